@@ -1,20 +1,44 @@
 import datetime
+import re
 import sqlite3
+import string
+
+# Pre-compiled check for positive decimal input, shared by money prompts
+_FLOAT_RE = re.compile(r"\d+(?:\.\d+)?\Z")
+
+# ASCII-only lowercase table: one C-level table pass per prompt instead
+# of the full Unicode case mapping done by str.lower
+_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 def connect_to_db(db_name="budget_tracker.db"):
     """
-    Connect to the SQLite database. If the database does not exist, it will be 
+    Connect to the SQLite database. If the database does not exist, it will be
     created.
-    
+
     Args:
         db_name (str): The name of the database file.
-    
+
     Returns:
-        sqlite3.Connection: Connection object to the SQLite database, or None 
+        sqlite3.Connection: Connection object to the SQLite database, or None
         if the connection fails.
     """
     try:
-        db = sqlite3.connect(db_name)
+        # A larger statement cache keeps every repeated query in this module
+        # prepared for the lifetime of the connection
+        db = sqlite3.connect(db_name, cached_statements=256)
+
+        # Name-based column access without building dicts per row
+        db.row_factory = sqlite3.Row
+
+        # Tune the connection: WAL avoids the rollback-journal double write
+        # and synchronous=NORMAL drops the post-commit fsync, which together
+        # make the frequent small commits in this app far cheaper.
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute("PRAGMA cache_size=-64000")
+        db.execute("PRAGMA mmap_size=268435456")
+        db.execute("PRAGMA foreign_keys=ON")
         return db
     except sqlite3.Error as e:
         print(f"Error connecting to database: {e}")
@@ -22,7 +46,7 @@ def connect_to_db(db_name="budget_tracker.db"):
 
 def create_tables(db):
     """
-    Create tables in the budget_tracker.db database to store expenses, income, 
+    Create tables in the budget_tracker.db database to store expenses, income,
     categories, and budgets.
 
     Args:
@@ -31,20 +55,17 @@ def create_tables(db):
     Returns:
         None
     """
-    # Create a cursor object to execute SQL commands
-    cursor = db.cursor()
-
     # Create table for expense categories
-    cursor.execute('''
+    db.execute('''
         CREATE TABLE IF NOT EXISTS expense_categories (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL UNIQUE,
-            budget_limit REAL
+            budget_limit INTEGER
         )
     ''')
 
     # Create table for income categories
-    cursor.execute('''
+    db.execute('''
         CREATE TABLE IF NOT EXISTS income_categories (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL UNIQUE
@@ -52,725 +73,678 @@ def create_tables(db):
     ''')
 
     # Create table for expenses
-    cursor.execute('''
+    db.execute('''
         CREATE TABLE IF NOT EXISTS expenses (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
+            date INTEGER NOT NULL
+                CHECK (date BETWEEN 10000101 AND 99991231),
             category_id INTEGER NOT NULL,
             description TEXT,
-            amount REAL NOT NULL,
+            amount INTEGER NOT NULL,
             FOREIGN KEY (category_id) REFERENCES expense_categories (id)
+                ON DELETE CASCADE
         )
     ''')
 
     # Create table for income
-    cursor.execute('''
+    db.execute('''
         CREATE TABLE IF NOT EXISTS income (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
+            date INTEGER NOT NULL
+                CHECK (date BETWEEN 10000101 AND 99991231),
             category_id INTEGER NOT NULL,
             description TEXT,
-            amount REAL NOT NULL,
+            amount INTEGER NOT NULL,
             FOREIGN KEY (category_id) REFERENCES income_categories (id)
+                ON DELETE CASCADE
         )
     ''')
 
     # Create table for budgets
-    cursor.execute('''
+    db.execute('''
         CREATE TABLE IF NOT EXISTS budgets (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             category_id INTEGER NOT NULL,
-            amount REAL NOT NULL,
+            amount INTEGER NOT NULL,
             FOREIGN KEY (category_id) REFERENCES expense_categories (id)
+                ON DELETE CASCADE
         )
     ''')
 
     # Create table for financial goals
-    cursor.execute('''
+    db.execute('''
         CREATE TABLE IF NOT EXISTS financial_goals (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_amount REAL NOT NULL,
+            goal_amount INTEGER NOT NULL,
             target_date TEXT NOT NULL,
             category_id INTEGER,
             FOREIGN KEY (category_id) REFERENCES expense_categories(id)
+                ON DELETE SET NULL
         )
     ''')
 
-    # Commit changes to the database
-    db.commit()
+    # Index the foreign-key columns (and expense dates) so per-category
+    # views, deletes and future date-range queries avoid full table scans.
+    # Including amount makes the per-category SUM queries index-only.
+    db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_expenses_category
+        ON expenses (category_id, amount)
+    ''')
+    db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_income_category
+        ON income (category_id, amount)
+    ''')
+    db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_expenses_date
+        ON expenses (date)
+    ''')
+    db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_income_date
+        ON income (date)
+    ''')
+    db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_budgets_category
+        ON budgets (category_id)
+    ''')
 
-def insert_preset_data(db):
+def _migrate_legacy_db(db):
+    """
+    Upgrade a database created before schema versioning to the current
+    schema.
+
+    Column types cannot be altered in place, so each table is renamed
+    aside, recreated with the current definition (integer YYYYMMDD
+    dates, CHECK constraints, cascade rules and indexes) and refilled
+    with converted rows, all in one transaction. Existing row ids are
+    preserved. The database is stamped with the current user_version so
+    the upgrade runs only once.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    tables = ('expense_categories', 'income_categories', 'expenses',
+              'income', 'budgets', 'financial_goals')
+
+    # Table renames and drops would trip enforcement mid-rebuild; the
+    # pragma only takes effect outside a transaction
+    db.execute("PRAGMA foreign_keys=OFF")
+    try:
+        with db:
+            for table in tables:
+                db.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+
+            create_tables(db)
+
+            # Legacy money columns hold REAL currency units; scale them
+            # to the integer cents the current schema stores
+            db.execute('''
+                INSERT INTO expense_categories (id, name, budget_limit)
+                SELECT id, name, CAST(ROUND(budget_limit * 100) AS INTEGER)
+                FROM expense_categories_legacy
+            ''')
+            db.execute('''
+                INSERT INTO income_categories (id, name)
+                SELECT id, name FROM income_categories_legacy
+            ''')
+
+            # Legacy dates are YYYY-MM-DD text; stripping the dashes
+            # yields the stored YYYYMMDD integer
+            for table in ('expenses', 'income'):
+                db.execute(f'''
+                    INSERT INTO {table} (id, date, category_id, description,
+                                         amount)
+                    SELECT id, CAST(REPLACE(date, '-', '') AS INTEGER),
+                           category_id, description,
+                           CAST(ROUND(amount * 100) AS INTEGER)
+                    FROM {table}_legacy
+                ''')
+
+            db.execute('''
+                INSERT INTO budgets (id, category_id, amount)
+                SELECT id, category_id,
+                       CAST(ROUND(amount * 100) AS INTEGER)
+                FROM budgets_legacy
+            ''')
+            db.execute('''
+                INSERT INTO financial_goals (id, goal_amount, target_date,
+                                             category_id)
+                SELECT id, CAST(ROUND(goal_amount * 100) AS INTEGER),
+                       target_date, category_id
+                FROM financial_goals_legacy
+            ''')
+
+            for table in tables:
+                db.execute(f'DROP TABLE {table}_legacy')
 
-    cursor = db.cursor()
+            db.execute("PRAGMA user_version = 1")
+    finally:
+        db.execute("PRAGMA foreign_keys=ON")
+
+def insert_preset_data(db):
 
     # Ensure the mtb category exists
-    cursor.execute('''
+    db.execute('''
         INSERT OR IGNORE INTO expense_categories (name) VALUES (?)
     ''', ('mtb',))
-    db.commit()
 
     # Retrieve the category ID for mtb
-    cursor.execute('''
+    mtb_category_id = db.execute('''
         SELECT id FROM expense_categories WHERE name = ?
-    ''', ('mtb',))
-    mtb_category_id = cursor.fetchone()[0]
+    ''', ('mtb',)).fetchone()[0]
 
-    expenses = [
-        ("2024-02-12", mtb_category_id, "bought mtb", 12000),
-        ("2024-03-01", mtb_category_id, "shifter parts", 500),
-        ("2024-04-05", mtb_category_id, "drivetrain parts", 3500),
-        ("2024-05-03", mtb_category_id, "brake bleeding kit", 400)
-    ]
-
-    cursor.executemany('''
+    # One multi-row VALUES insert: a single statement prepare and step
+    # instead of executemany's per-row loop
+    db.execute('''
         INSERT INTO expenses (date, category_id, description, amount)
-        VALUES (?, ?, ?, ?)
-    ''', expenses)
-    db.commit()
-
-# Define functions for menu options
-def add_expense(db):
+        VALUES (?, ?, ?, ?), (?, ?, ?, ?), (?, ?, ?, ?), (?, ?, ?, ?)
+    ''', (
+        20240212, mtb_category_id, "bought mtb", 1200000,
+        20240301, mtb_category_id, "shifter parts", 50000,
+        20240405, mtb_category_id, "drivetrain parts", 350000,
+        20240503, mtb_category_id, "brake bleeding kit", 40000,
+    ))
+
+def import_expenses_bulk(db, rows):
     """
-    Add a new expense to the database.
+    Insert many expenses at once, e.g. from a CSV import.
+
+    Using executemany inside a single transaction keeps the whole import
+    down to one statement prepare and one commit, which is orders of
+    magnitude faster than inserting row by row.
 
     Args:
         db (sqlite3.Connection): Connection object to the SQLite database.
+        rows (iterable): (date, category_id, description, amount)
+            tuples, with date as a YYYYMMDD integer and amount in
+            integer cents.
 
     Returns:
         None
     """
-    while True:
-        # Prompt user for expense details
-        date = input("Enter the date of the expense (YYYY-MM-DD): ").lower()
-        
-        # Validate date format
-        try:
-            datetime.datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
-            print("Invalid date format. Please enter the date in YYYY-MM-DD "
-                  "format.")
-            continue
-        
-        category_name = input("Enter the category name of the expense: "
-                              ).lower()
-        description = input("Enter a description of the expense: ").lower()
-
-        # Prompt user for the amount of the expense
-        while True:
-            amount_input = input("Enter the amount of the expense: ").strip()
-            if amount_input == "":
-                print("Amount cannot be empty. Please enter a valid amount.")
-                continue
-            try:
-                amount = float(amount_input)
-                break
-            except ValueError:
-                print("Invalid amount format. Please enter a valid number.")
-
-        try:
-            # Create a cursor object to execute SQL commands
-            cursor = db.cursor()
-
-            # Check if the category already exists
-            cursor.execute('''
-                SELECT id FROM expense_categories WHERE name = ?
-            ''', (category_name,))
-            category = cursor.fetchone()
-            
-            # If category does not exist, create it
-            if category is None:
-                cursor.execute('''
-                    INSERT INTO expense_categories (name) VALUES (?)
-                ''', (category_name,))
-                db.commit()
-
-                # Get the new category id
-                category_id = cursor.lastrowid
-            else:
-                # Use existing category id
-                category_id = category[0]
-
-            # Retrieve the latest ID from the expenses table
-            cursor.execute("SELECT MAX(id) FROM expenses")
-            latest_id = cursor.fetchone()[0]
-
-            # Increment the latest ID by 1 to generate a new ID
-            new_id = latest_id + 1 if latest_id is not None else 1
-
-            # Insert the new expense into the 'expenses' table
-            cursor.execute('''
-                INSERT INTO expenses (id, date, category_id, description, 
-                           amount)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (new_id, date, category_id, description, amount))
-
-            # Commit the transaction
-            db.commit()
-                        
-            # Prompt user for confirmation
-            while True:
-                confirm = input("Do you confirm to add this expense? "
-                                "(yes/no): ").lower()
-                if confirm == 'yes':
-                    print("\nExpense added successfully.\n")
-                    return
-                elif confirm == 'no':
-                    cursor.execute("DELETE FROM expenses WHERE id=?", 
-                                   (new_id,))
-                    db.commit()
-                    print("Expense not added.")
-                    return  # Return to main menu
-                else:
-                    print("Invalid choice. Please enter 'yes' or 'no'.")
-
-        except sqlite3.Error as e:
-            # Print error message if insertion fails
-            print(f"Error adding expense: {e}")
-
-def view_expenses(db):
+    # Callers supply validated category ids, so the per-row foreign-key
+    # probe is pure overhead; the pragma only takes effect outside a
+    # transaction, hence toggled around the 'with db:' scope
+    db.execute("PRAGMA foreign_keys=OFF")
+    try:
+        with db:
+            db.executemany('''
+                INSERT INTO expenses (date, category_id, description, amount)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+    finally:
+        db.execute("PRAGMA foreign_keys=ON")
+
+def add_expenses_many(db, rows):
     """
-    View all expenses, update an expense, or delete an expense.
+    Add many expenses at once by category name, e.g. from a CSV import.
+
+    Category names are resolved (and created if needed) through the
+    session's name -> id cache, so repeated names cost a dict hit, and
+    the rows land via one executemany inside a single transaction.
 
     Args:
         db (sqlite3.Connection): Connection object to the SQLite database.
+        rows (iterable): (date, category_name, description, amount)
+            tuples, with date as YYYY-MM-DD text and amount in integer
+            cents.
 
     Returns:
         None
     """
-    cursor = db.cursor()
-
-    # Fetch all expenses from the database
-    cursor.execute('''
-        SELECT expenses.id, expenses.date, expense_categories.name, 
-                   expenses.description, expenses.amount
-        FROM expenses
-        JOIN expense_categories ON expenses.category_id = expense_categories.id
-    ''')
-    expenses = cursor.fetchall()
+    sql = _ENTRY_SQL['expenses']
 
-    if not expenses:
-        print("No expenses found.\n")
-        return
+    # Category ids come straight from the upserts below, so skip the
+    # per-row foreign-key probe for the duration of the import
+    db.execute("PRAGMA foreign_keys=OFF")
+    try:
+        try:
+            with db:
+                db.executemany(sql['insert_entry'], (
+                    (_date_to_int(date), _category_id(db, sql, name),
+                     description, amount)
+                    for date, name, description, amount in rows))
+        except Exception:
+            # The rollback may have undone categories whose ids were
+            # just cached; drop them so a retry cannot reuse a dead id
+            _invalidate_categories(sql['cat_table'])
+            raise
+    finally:
+        db.execute("PRAGMA foreign_keys=ON")
+
+def _build_entry_sql(table, cat_table):
+    """
+    Build the SQL statements used by the shared expense/income helpers for
+    one table pair.
+
+    The text is built once at import time so every execute passes the exact
+    same string and sqlite3's prepared-statement cache always hits.
+
+    Args:
+        table (str): Name of the entries table ('expenses' or 'income').
+        cat_table (str): Name of the matching categories table.
 
-    # Display all expenses and calculate total amount
-    total_amount = 0
-    print("\nExpenses:\n")
-    for expense in expenses:
-        print(f"ID: {expense[0]}, Date: {expense[1]}, Category: {expense[2]}, "
-              f"Description: {expense[3]}, Amount: {expense[4]}\n")
-        total_amount += expense[4]
+    Returns:
+        dict: Statement name to SQL text.
+    """
+    return {
+        'upsert_category': f'''
+            INSERT INTO {cat_table} (name) VALUES (?)
+            ON CONFLICT (name) DO UPDATE SET name = name
+            RETURNING id
+        ''',
+        'insert_entry': f'''
+            INSERT INTO {table} (date, category_id, description, amount)
+            VALUES (?, ?, ?, ?)
+        ''',
+        'sum_entries': f'SELECT SUM(amount) FROM {table}',
+        'select_entries': f'''
+            SELECT {table}.id, {table}.date, {cat_table}.name,
+                       {table}.description, {table}.amount
+            FROM {table}
+            JOIN {cat_table} ON {table}.category_id = {cat_table}.id
+        ''',
+        'update_entry': f'''
+            UPDATE {table}
+            SET date = COALESCE(?, date),
+                category_id = COALESCE(?, category_id),
+                description = COALESCE(?, description),
+                amount = COALESCE(?, amount)
+            WHERE id = ?
+        ''',
+        'entry_exists': f'SELECT 1 FROM {table} WHERE id = ? LIMIT 1',
+        'delete_entry': f'DELETE FROM {table} WHERE id = ?',
+        'select_categories': f'SELECT id, name FROM {cat_table}',
+        'category_exists': f'SELECT 1 FROM {cat_table} WHERE id = ? LIMIT 1',
+        'sum_by_category':
+            f'SELECT SUM(amount) FROM {table} WHERE category_id = ?',
+        'select_by_category': f'''
+            SELECT {table}.id, {table}.date, {cat_table}.name,
+                   {table}.description, {table}.amount
+            FROM {table}
+            JOIN {cat_table} ON {table}.category_id = {cat_table}.id
+            WHERE {cat_table}.id = ?
+        ''',
+        'cat_table': cat_table,
+        'delete_category': f'DELETE FROM {cat_table} WHERE id = ?',
+        'update_category_name':
+            f'UPDATE {cat_table} SET name = ? WHERE id = ?',
+        'delete_orphan_categories': f'''
+            DELETE FROM {cat_table}
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {table}
+                WHERE {table}.category_id = {cat_table}.id
+            )
+        ''',
+    }
+
+# The expense and income paths share one implementation; the table names
+# are filled in once here (they are never user input)
+_ENTRY_SQL = {
+    'expenses': _build_entry_sql('expenses', 'expense_categories'),
+    'income': _build_entry_sql('income', 'income_categories'),
+}
+
+# Categories change rarely, so the (id, name) listings shown by several
+# menus are cached per table and refetched only after a category has been
+# added, renamed or deleted
+_category_cache = {}
+_category_id_cache = {}
+
+def _prompt_positive_float(prompt):
+    """
+    Prompt until the user enters a positive number and return it as a float.
 
-    print(f"Total Amount: {total_amount}\n")
+    Args:
+        prompt (str): Message displayed to the user.
 
+    Returns:
+        float: The validated positive amount.
+    """
     while True:
-        action = input("Enter the ID of the expense to update/delete, or "
-                       "'back' to return to the main menu: ").strip().lower()
-        
-        if action == 'back':
-            return
+        raw = input(prompt).strip()
+        if _FLOAT_RE.fullmatch(raw) and float(raw) > 0:
+            return float(raw)
+        print("Invalid input. Please enter a positive number.\n")
 
-        try:
-            expense_id = int(action)
-        except ValueError:
-            print("Invalid ID. Please enter a valid expense ID.\n")
-            continue
 
-        # Check if the entered ID is valid
-        cursor.execute('''
-            SELECT id FROM expenses WHERE id = ?
-        ''', (expense_id,))
-        if not cursor.fetchone():
-            print("Expense ID not found. Please enter a valid expense ID.\n")
-            continue
+def _date_to_int(date):
+    """
+    Convert a validated YYYY-MM-DD string to the stored YYYYMMDD integer.
 
-        # Ask user for the action to perform on the selected expense
-        update_delete = input("\nWould you like to update or delete this "
-                              "expense? (update/delete): \n").strip().lower()
-        
-        if update_delete == 'delete':
-            try:
-                cursor.execute('''
-                    DELETE FROM expenses WHERE id = ?
-                ''', (expense_id,))
-                db.commit()
-                print("\nExpense deleted successfully.\n")
-            except sqlite3.Error as e:
-                print(f"Error deleting expense: {e}\n")
-            return
+    Args:
+        date (str): ISO-format date string.
 
-        elif update_delete == 'update':
-            # Update expense details
-            new_date = input("Enter the new date of the expense (YYYY-MM-DD), "
-                             "or press enter to keep the current date: \n"
-                             ).strip().lower()
-            if new_date:
-                try:
-                    datetime.datetime.strptime(new_date, "%Y-%m-%d")
-                except ValueError:
-                    print("Invalid date format. Please enter the date in "
-                          "YYYY-MM-DD format.\n")
-                    continue
+    Returns:
+        int: The date as YYYYMMDD.
+    """
+    return int(date.replace("-", ""))
 
-            new_category = input("Enter the new category of the expense, or "
-                                 "press enter to keep the current category: \n"
-                                 ).strip().lower()
-            new_description = input("Enter the new description of the "
-                                    "expense, or press enter to keep the "
-                                    "current description: \n").strip().lower()
-            new_amount_input = input("Enter the new amount of the expense, or "
-                                     "press enter to keep the current "
-                                     "amount: \n"
-                                     ).strip()
-            if new_amount_input:
-                try:
-                    new_amount = float(new_amount_input)
-                except ValueError:
-                    print("Invalid amount format. Please enter a valid "
-                          "number.\n")
-                    continue
+def _fmt_date(date_int):
+    """
+    Format a stored YYYYMMDD integer back to YYYY-MM-DD for display.
 
-            try:
-                # Update the expense details in the database
-                if new_date:
-                    cursor.execute('''
-                        UPDATE expenses SET date = ? WHERE id = ?
-                    ''', (new_date, expense_id))
-                
-                if new_category:
-                    cursor.execute('''
-                        SELECT id FROM expense_categories WHERE name = ?
-                    ''', (new_category,))
-                    category = cursor.fetchone()
-                    
-                    if category is None:
-                        cursor.execute('''
-                            INSERT INTO expense_categories (name) VALUES (?)
-                        ''', (new_category,))
-                        db.commit()
-                        category_id = cursor.lastrowid
-                    else:
-                        category_id = category[0]
-                    
-                    cursor.execute('''
-                        UPDATE expenses SET category_id = ? WHERE id = ?
-                    ''', (category_id, expense_id))
-
-                if new_description:
-                    cursor.execute('''
-                        UPDATE expenses SET description = ? WHERE id = ?
-                    ''', (new_description, expense_id))
-                
-                if new_amount_input:
-                    cursor.execute('''
-                        UPDATE expenses SET amount = ? WHERE id = ?
-                    ''', (new_amount, expense_id))
-
-                db.commit()
-                print("Expense updated successfully.\n")
-            except sqlite3.Error as e:
-                print(f"Error updating expense: {e}\n")
-            return
+    Args:
+        date_int (int): Date as YYYYMMDD.
 
-        else:
-            print("Invalid choice. Please enter 'update' or 'delete'.\n")
+    Returns:
+        str: ISO-format date string.
+    """
+    return (f"{date_int // 10000:04d}-{date_int // 100 % 100:02d}-"
+            f"{date_int % 100:02d}")
 
-def view_expenses_by_category(db):
+def _fmt_amount(cents):
     """
-    View all expenses by category, update a category name or delete a category 
-    and all associated expenses.
+    Format an integer-cents amount for display.
 
     Args:
-        db (sqlite3.Connection): Connection object to the SQLite database.
+        cents (int): Amount in cents.
 
     Returns:
-        None
+        str: The amount with two decimal places.
     """
-    cursor = db.cursor()
+    return f"{cents / 100:.2f}"
 
-    # Fetch all expense categories from the database
-    cursor.execute('SELECT id, name FROM expense_categories')
-    categories = cursor.fetchall()
-
-    if not categories:
-        print("No expense categories found.\n")
-        return
+def _get_categories(db, cat_table):
+    """
+    Return the cached (id, name) rows for a category table, querying the
+    database only on the first call after an invalidation.
 
-    # Display all categories
-    print("Expense Categories:\n")
-    for category in categories:
-        print(f"ID: {category[0]}, Name: {category[1]}\n")
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+        cat_table (str): Name of the categories table.
 
-    while True:
-        action = input("Enter the ID of the category to view/update/delete, "
-                       "or 'back' to return to the main menu: "
-                       ).strip().lower()
-        
-        if action == 'back':
-            # Check for categories with no associated expenses and delete them
-            cursor.execute('''
-                DELETE FROM expense_categories 
-                WHERE id NOT IN (SELECT DISTINCT category_id FROM expenses)
-            ''')
-            db.commit()
-            return
+    Returns:
+        list: (id, name) tuples for every category.
+    """
+    if cat_table not in _category_cache:
+        _category_cache[cat_table] = db.execute(
+            f'SELECT id, name FROM {cat_table}').fetchall()
+    return _category_cache[cat_table]
 
-        try:
-            category_id = int(action)
-        except ValueError:
-            print("Invalid ID. Please enter a valid category ID.\n")
-            continue
+def _invalidate_categories(cat_table):
+    """
+    Drop the cached category listing after a category mutation.
 
-        # Check if the entered ID is valid
-        cursor.execute('SELECT id FROM expense_categories WHERE id = ?', 
-                       (category_id,))
-        if not cursor.fetchone():
-            print("Category ID not found. Please enter a valid category ID.\n")
-            continue
+    Args:
+        cat_table (str): Name of the categories table.
 
-        # Fetch all expenses associated with the selected category
-        cursor.execute('''
-            SELECT expenses.id, expenses.date, expense_categories.name, 
-                   expenses.description, expenses.amount
-            FROM expenses
-            JOIN expense_categories ON expenses.category_id = 
-                       expense_categories.id
-            WHERE expense_categories.id = ?
-        ''', (category_id,))
-        expenses = cursor.fetchall()
-
-        if not expenses:
-            print(f"No expenses found for category ID {category_id}.\n")
-        else:
-            total_amount = 0
-            print(f"Expenses for Category ID {category_id}:\n")
-            for expense in expenses:
-                print(f"ID: {expense[0]}, Date: {expense[1]}, "
-                      f"Category: {expense[2]}, Description: {expense[3]}, "
-                      f"Amount: {expense[4]}\n")
-                total_amount += expense[4]
-            print(f"Total Amount for Category ID {category_id}: {total_amount}"
-                  "\n")
+    Returns:
+        None
+    """
+    _category_cache.pop(cat_table, None)
+    _category_id_cache.pop(cat_table, None)
 
-        # Ask user for the action to perform on the selected category
-        update_delete = input("Would you like to update or delete this "
-                              "category? (update/delete/back): "
-                              ).strip().lower()
-        
-        if update_delete == 'delete':
-            try:
-                # Delete all expenses associated with the category
-                cursor.execute('DELETE FROM expenses WHERE category_id = ?', 
-                               (category_id,))
-                # Delete the category itself
-                cursor.execute('DELETE FROM expense_categories WHERE id = ?', 
-                               (category_id,))
-                db.commit()
-                print("Category and all associated expenses deleted "
-                      "successfully.\n")
-            except sqlite3.Error as e:
-                print(f"Error deleting category: {e}\n")
-            return
+def _category_id(db, sql, name):
+    """
+    Resolve a category name to its id, creating the category if needed.
 
-        elif update_delete == 'update':
-            new_name = input("Enter the new name for the category, or press "
-                             "enter to keep the current name: ").strip()
-            
-            if new_name:
-                try:
-                    # Update the category name in the database
-                    cursor.execute('UPDATE expense_categories SET name = ? '
-                                   'WHERE id = ?', (new_name, category_id))
-                    db.commit()
-                    print("Category name updated successfully.\n")
-                except sqlite3.Error as e:
-                    print(f"Error updating category name: {e}\n")
-                return
-            
-        elif update_delete == 'back':
-            continue
+    An in-process name -> id cache answers repeat names without touching
+    the database; only genuinely new names run the upsert.
 
-        else:
-            print("Invalid choice. Please enter 'update' or 'delete'.\n")
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+        sql (dict): Statement dict for the table pair (_ENTRY_SQL entry).
+        name (str): Category name entered by the user.
 
-def add_income(db):
+    Returns:
+        int: The category's id.
     """
-    Add a new income to the database.
+    ids = _category_id_cache.setdefault(sql['cat_table'], {})
+    category_id = ids.get(name)
+    if category_id is None:
+        # The no-op DO UPDATE forces RETURNING to yield a row for
+        # existing categories too
+        category_id = db.execute(
+            sql['upsert_category'], (name,)).fetchone()[0]
+        # Only the listing cache goes stale when a category is created;
+        # the name -> id mappings gathered so far all remain valid
+        _category_cache.pop(sql['cat_table'], None)
+        ids[name] = category_id
+    return category_id
+
+# Define helpers shared by the expense and income menu options. The two
+# data sets use identical schemas, so one implementation serves both.
+def _add_entry(db, table, label):
+    """
+    Add a new expense or income entry to the database.
 
     Args:
         db (sqlite3.Connection): Connection object to the SQLite database.
+        table (str): Name of the entries table ('expenses' or 'income').
+        label (str): Word used in prompts and messages, e.g. 'expense'.
 
     Returns:
         None
     """
+    sql = _ENTRY_SQL[table]
+
+    # Bind the validator once so the input loop skips the attribute chain
+    parse_date = datetime.date.fromisoformat
+
     while True:
-        # Prompt user for income details
-        date = input("Enter the date of the income (YYYY-MM-DD): ").lower()
-        
-        # Validate date format
+        # Prompt user for entry details
+        date = input(f"Enter the date of the {label} (YYYY-MM-DD): ").translate(_LOWER)
+
+        # Validate date format (fromisoformat is the C fast path for
+        # YYYY-MM-DD, unlike strptime which interprets the format string)
         try:
-            datetime.datetime.strptime(date, "%Y-%m-%d")
+            parse_date(date)
         except ValueError:
             print("Invalid date format. Please enter the date in YYYY-MM-DD "
                   "format.\n")
             continue
-        
-        category_name = input("Enter the category name of the income: "
-                              ).lower()
-        description = input("Enter a description of the income: ").lower()
 
-        # Prompt user for the amount of the income
+        category_name = input(f"Enter the category name of the {label}: "
+                              ).translate(_LOWER)
+        description = input(f"Enter a description of the {label}: ").translate(_LOWER)
+
+        # Prompt user for the amount of the entry. The compiled regex
+        # vets the text before float() so bad input never raises.
         while True:
-            amount_input = input("Enter the amount of the income: ").strip()
-            if amount_input == "":
-                print("Amount cannot be empty. Please enter a valid amount.\n")
-                continue
-            try:
-                amount = float(amount_input)
+            amount_input = input(f"Enter the amount of the {label}: ").strip()
+            if _FLOAT_RE.fullmatch(amount_input):
+                # Money is stored as integer cents (exact, and cheaper
+                # for SQLite to store and sum than 8-byte doubles)
+                amount = round(float(amount_input) * 100)
                 break
-            except ValueError:
-                print("Invalid amount format. Please enter a valid number.\n")
+            print("Invalid amount format. Please enter a valid number.\n")
+
+        # Show the entry and ask for confirmation before touching the
+        # database; a rejected entry then costs no writes at all
+        print(f"\nDate: {date}, Category: {category_name}, "
+              f"Description: {description}, Amount: {_fmt_amount(amount)}")
+        while True:
+            confirm = input(f"Do you confirm to add this {label}? "
+                            "(yes/no): ").translate(_LOWER)
+            if confirm in ('yes', 'no'):
+                break
+            print("Invalid choice. Please enter 'yes' or 'no'.\n")
+
+        if confirm == 'no':
+            print(f"{label.capitalize()} not added.\n")
+            return  # Return to main menu
 
         try:
-            # Create a cursor object to execute SQL commands
-            cursor = db.cursor()
-
-            # Check if the category already exists
-            cursor.execute('''
-                SELECT id FROM income_categories WHERE name = ?
-            ''', (category_name,))
-            category = cursor.fetchone()
-            
-            # If category does not exist, create it
-            if category is None:
-                cursor.execute('''
-                    INSERT INTO income_categories (name) VALUES (?)
-                ''', (category_name,))
-                db.commit()
-
-                # Get the new category id
-                category_id = cursor.lastrowid
-            else:
-                # Use existing category id
-                category_id = category[0]
-
-            # Retrieve the latest ID from the income table
-            cursor.execute("SELECT MAX(id) FROM income")
-            latest_id = cursor.fetchone()[0]
-
-            # Increment the latest ID by 1 to generate a new ID
-            new_id = latest_id + 1 if latest_id is not None else 1
-
-            # Insert the new income into the 'income' table
-            cursor.execute('''
-                INSERT INTO income (id, date, category_id, description, amount)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (new_id, date, category_id, description, amount))
-
-            # Commit the transaction
-            db.commit()
-                        
-            # Prompt user for confirmation
-            while True:
-                confirm = input("Do you confirm to add this income? (yes/no): "
-                                ).lower()
-                if confirm == 'yes':
-                    print("\nIncome added successfully.\n")
-                    return
-                elif confirm == 'no':
-                    cursor.execute("DELETE FROM income WHERE id=?", (new_id,))
-                    db.commit()
-                    print("Income not added.\n")
-                    return  # Return to main menu
-                else:
-                    print("Invalid choice. Please enter 'yes' or 'no'.\n")
+            # Write the category (if new) and the entry in one transaction
+            with db:
+                category_id = _category_id(db, sql, category_name)
+
+                # Insert the new entry and let SQLite assign the ID
+                db.execute(sql['insert_entry'],
+                           (_date_to_int(date), category_id, description,
+                            amount))
+
+            print(f"\n{label.capitalize()} added successfully.\n")
+            return
 
         except sqlite3.Error as e:
-            # Print error message if insertion fails
-            print(f"Error adding income: {e}\n")
+            # Print error message if insertion fails. The rollback may
+            # have undone a category the helper just cached.
+            _invalidate_categories(sql['cat_table'])
+            print(f"Error adding {label}: {e}\n")
 
-def view_income(db):
+def _view_entries(db, table, label):
     """
-    View all incomes, update an income, or delete an income.
+    View all expense or income entries, update an entry, or delete an entry.
 
     Args:
         db (sqlite3.Connection): Connection object to the SQLite database.
+        table (str): Name of the entries table ('expenses' or 'income').
+        label (str): Word used in prompts and messages, e.g. 'expense'.
 
     Returns:
         None
     """
-    cursor = db.cursor()
-
-    # Fetch all incomes from the database
-    cursor.execute('''
-        SELECT income.id, income.date, income_categories.name, 
-                   income.description, income.amount
-        FROM income
-        JOIN income_categories ON income.category_id = income_categories.id
-    ''')
-    incomes = cursor.fetchall()
+    sql = _ENTRY_SQL[table]
 
-    if not incomes:
-        print("No income found.\n")
+    # Let SQLite compute the total instead of summing row by row in Python;
+    # a NULL sum also means there are no entries at all
+    total_amount = db.execute(sql['sum_entries']).fetchone()[0]
+
+    if total_amount is None:
+        print(f"No {label}s found.\n")
         return
 
-    # Display all income and calculate total amount
-    total_amount = 0
-    print("\nIncomes:\n")
-    for income in incomes:
-        print(f"ID: {income[0]}, Date: {income[1]}, Category: {income[2]}, "
-              f"Description: {income[3]}, Amount: {income[4]}\n")
-        total_amount += income[4]
+    # Fetch all entries from the database
+    cursor = db.execute(sql['select_entries'])
+
+    # Display all entries, streaming rows straight off the cursor instead
+    # of materialising the whole result set first
+    print(f"\n{label.capitalize()}s:\n")
+    for entry in cursor:
+        print(f"ID: {entry['id']}, Date: {_fmt_date(entry['date'])}, "
+              f"Category: {entry['name']}, "
+              f"Description: {entry['description']}, "
+              f"Amount: {_fmt_amount(entry['amount'])}\n")
 
-    print(f"Total Amount: {total_amount}\n")
+    print(f"Total Amount: {_fmt_amount(total_amount)}\n")
 
     while True:
-        action = input("Enter the ID of the income to update/delete, or 'back'"
-                       " to return to the main menu: ").strip().lower()
-        
+        action = input(f"Enter the ID of the {label} to update/delete, or "
+                       "'back' to return to the main menu: ").strip().translate(_LOWER)
+
         if action == 'back':
             return
 
         try:
-            income_id = int(action)
+            entry_id = int(action)
         except ValueError:
-            print("Invalid ID. Please enter a valid income ID.\n")
+            print(f"Invalid ID. Please enter a valid {label} ID.\n")
             continue
 
         # Check if the entered ID is valid
-        cursor.execute('''
-            SELECT id FROM income WHERE id = ?
-        ''', (income_id,))
-        if not cursor.fetchone():
-            print("Income ID not found. Please enter a valid income ID.\n")
+        if not db.execute(sql['entry_exists'], (entry_id,)).fetchone():
+            print(f"{label.capitalize()} ID not found. Please enter a valid "
+                  f"{label} ID.\n")
             continue
 
-        # Ask user for the action to perform on the selected income
+        # Ask user for the action to perform on the selected entry
         update_delete = input("Would you like to update or delete this "
-                              "income? (update/delete): ").strip().lower()
-        
+                              f"{label}? (update/delete): ").strip().translate(_LOWER)
+
         if update_delete == 'delete':
             try:
-                cursor.execute('''
-                    DELETE FROM income WHERE id = ?
-                ''', (income_id,))
-                db.commit()
-                print("Income deleted successfully.\n")
+                with db:
+                    db.execute(sql['delete_entry'], (entry_id,))
+                print(f"\n{label.capitalize()} deleted successfully.\n")
             except sqlite3.Error as e:
-                print(f"Error deleting income: {e}\n")
+                print(f"Error deleting {label}: {e}\n")
             return
 
         elif update_delete == 'update':
-            # Update income details
-            new_date = input("Enter the new date of the income (YYYY-MM-DD), "
-                             "or press enter to keep the current date: "
-                             ).strip().lower()
+            # Update entry details
+            new_date = input(f"Enter the new date of the {label} "
+                             "(YYYY-MM-DD), or press enter to keep the "
+                             "current date: \n").strip().translate(_LOWER)
             if new_date:
                 try:
-                    datetime.datetime.strptime(new_date, "%Y-%m-%d")
+                    datetime.date.fromisoformat(new_date)
                 except ValueError:
                     print("Invalid date format. Please enter the date in "
                           "YYYY-MM-DD format.\n")
                     continue
 
-            new_category = input("Enter the new category of the income, or "
+            new_category = input(f"Enter the new category of the {label}, or "
                                  "press enter to keep the current category: "
-                                 "\n").strip().lower()
-            new_description = input("Enter the new description of the income, "
-                                    "or press enter to keep the current "
-                                    "description: \n").strip().lower()
-            new_amount_input = input("Enter the new amount of the income, or "
-                                     "press enter to keep the current amount: "
-                                     "\n").strip()
+                                 "\n").strip().translate(_LOWER)
+            new_description = input("Enter the new description of the "
+                                    f"{label}, or press enter to keep the "
+                                    "current description: \n").strip().translate(_LOWER)
+            new_amount_input = input(f"Enter the new amount of the {label}, "
+                                     "or press enter to keep the current "
+                                     "amount: \n").strip()
             if new_amount_input:
-                try:
-                    new_amount = float(new_amount_input)
-                except ValueError:
+                if not _FLOAT_RE.fullmatch(new_amount_input):
                     print("Invalid amount format. Please enter a valid "
                           "number.\n")
                     continue
+                new_amount = round(float(new_amount_input) * 100)
 
             try:
-                # Update the income details in the database
-                if new_date:
-                    cursor.execute('''
-                        UPDATE income SET date = ? WHERE id = ?
-                    ''', (new_date, income_id))
-                
-                if new_category:
-                    cursor.execute('''
-                        SELECT id FROM income_categories WHERE name = ?
-                    ''', (new_category,))
-                    category = cursor.fetchone()
-                    
-                    if category is None:
-                        cursor.execute('''
-                            INSERT INTO income_categories (name) VALUES (?)
-                        ''', (new_category,))
-                        db.commit()
-                        category_id = cursor.lastrowid
-                    else:
-                        category_id = category[0]
-                    
-                    cursor.execute('''
-                        UPDATE income SET category_id = ? WHERE id = ?
-                    ''', (category_id, income_id))
-
-                if new_description:
-                    cursor.execute('''
-                        UPDATE income SET description = ? WHERE id = ?
-                    ''', (new_description, income_id))
-                
-                if new_amount_input:
-                    cursor.execute('''
-                        UPDATE income SET amount = ? WHERE id = ?
-                    ''', (new_amount, income_id))
-
-                db.commit()
-                print("Income updated successfully.\n")
+                # One constant UPDATE covers every field combination:
+                # COALESCE keeps the stored value wherever None is bound,
+                # so the statement text never changes and stays cached
+                # Any category insert and the update commit together
+                with db:
+                    category_id = (_category_id(db, sql, new_category)
+                                   if new_category else None)
+
+                    db.execute(sql['update_entry'], (
+                        _date_to_int(new_date) if new_date else None,
+                        category_id,
+                        new_description or None,
+                        new_amount if new_amount_input else None,
+                        entry_id))
+
+                print(f"{label.capitalize()} updated successfully.\n")
             except sqlite3.Error as e:
-                print(f"Error updating income: {e}\n")
+                _invalidate_categories(sql['cat_table'])
+                print(f"Error updating {label}: {e}\n")
             return
 
         else:
             print("Invalid choice. Please enter 'update' or 'delete'.\n")
 
-def view_income_by_category(db):
+def _view_entries_by_category(db, table, label):
     """
-    View all incomes by category, update a category name or delete a category
-    and all associated incomes.
+    View all expense or income entries by category, update a category name or
+    delete a category and all associated entries.
 
     Args:
         db (sqlite3.Connection): Connection object to the SQLite database.
+        table (str): Name of the entries table ('expenses' or 'income').
+        label (str): Word used in prompts and messages, e.g. 'expense'.
 
     Returns:
         None
     """
-    cursor = db.cursor()
+    sql = _ENTRY_SQL[table]
 
-    # Fetch all income categories from the database
-    cursor.execute('SELECT id, name FROM income_categories')
-    categories = cursor.fetchall()
+    # Fetch all categories (cached between category mutations)
+    categories = _get_categories(db, sql['cat_table'])
 
     if not categories:
-        print("No income categories found.\n")
+        print(f"No {label} categories found.\n")
         return
 
     # Display all categories
-    print("Income Categories:\n")
+    print(f"{label.capitalize()} Categories:\n")
     for category in categories:
-        print(f"ID: {category[0]}, Name: {category[1]}\n")
+        print(f"ID: {category['id']}, Name: {category['name']}\n")
 
     while True:
         action = input("Enter the ID of the category to view/update/delete, "
-                       "or 'back' to return to the main menu: ").strip().lower()
+                       "or 'back' to return to the main menu: "
+                       ).strip().translate(_LOWER)
 
         if action == 'back':
-            # Check for categories with no associated incomes and delete them
-            cursor.execute('''
-                DELETE FROM income_categories
-                WHERE id NOT IN (SELECT DISTINCT category_id FROM income)
-            ''')
-            db.commit()
+            # Check for categories with no associated entries and delete them
+            with db:
+                db.execute(sql['delete_orphan_categories'])
+            _invalidate_categories(sql['cat_table'])
             return
 
         try:
@@ -780,50 +754,43 @@ def view_income_by_category(db):
             continue
 
         # Check if the entered ID is valid
-        cursor.execute('SELECT id FROM income_categories WHERE id = ?', 
-                       (category_id,))
-        if not cursor.fetchone():
+        if not db.execute(sql['category_exists'],
+                          (category_id,)).fetchone():
             print("Category ID not found. Please enter a valid category ID.\n")
             continue
 
-        # Fetch all incomes associated with the selected category
-        cursor.execute('''
-            SELECT income.id, income.date, income_categories.name,
-                   income.description, income.amount
-            FROM income
-            JOIN income_categories ON income.category_id = income_categories.id
-            WHERE income_categories.id = ?
-        ''', (category_id,))
-        incomes = cursor.fetchall()
+        # Total for the category in SQL; NULL means it has no entries
+        total_amount = db.execute(sql['sum_by_category'],
+                                  (category_id,)).fetchone()[0]
 
-        if not incomes:
-            print(f"No incomes found for category ID {category_id}.\n")
+        if total_amount is None:
+            print(f"No {label}s found for category ID {category_id}.\n")
         else:
-            total_amount = 0
-            print(f"Incomes for Category ID {category_id}:\n")
-            for income in incomes:
-                print(f"ID: {income[0]}, Date: {income[1]}, "
-                      f"Category: {income[2]}, Description: {income[3]}, "
-                      f"Amount: {income[4]}\n")
-                total_amount += income[4]
+            # Stream the entries associated with the selected category
+            cursor = db.execute(sql['select_by_category'], (category_id,))
+
+            print(f"{label.capitalize()}s for Category ID {category_id}:\n")
+            for entry in cursor:
+                print(f"ID: {entry['id']}, Date: {_fmt_date(entry['date'])}, "
+                      f"Category: {entry['name']}, "
+                      f"Description: {entry['description']}, "
+                      f"Amount: {_fmt_amount(entry['amount'])}\n")
             print(f"Total Amount for Category ID {category_id}: "
-                  f"{total_amount}\n")
+                  f"{_fmt_amount(total_amount)}\n")
 
         # Ask user for the action to perform on the selected category
         update_delete = input("Would you like to update or delete this "
                               "category? (update/delete/back): "
-                              ).strip().lower()
+                              ).strip().translate(_LOWER)
 
         if update_delete == 'delete':
             try:
-                # Delete all incomes associated with the category
-                cursor.execute('DELETE FROM income WHERE category_id = ?', 
-                               (category_id,))
-                # Delete the category itself
-                cursor.execute('DELETE FROM income_categories WHERE id = ?', 
-                               (category_id,))
-                db.commit()
-                print("Category and all associated incomes deleted "
+                # Delete the category; ON DELETE CASCADE removes all
+                # associated entries in the same statement
+                with db:
+                    db.execute(sql['delete_category'], (category_id,))
+                _invalidate_categories(sql['cat_table'])
+                print(f"Category and all associated {label}s deleted "
                       "successfully.\n")
             except sqlite3.Error as e:
                 print(f"Error deleting category: {e}\n")
@@ -836,20 +803,96 @@ def view_income_by_category(db):
             if new_name:
                 try:
                     # Update the category name in the database
-                    cursor.execute('UPDATE income_categories SET name = ? '
-                                   'WHERE id = ?', (new_name, category_id))
-                    db.commit()
+                    with db:
+                        db.execute(sql['update_category_name'],
+                                   (new_name, category_id))
+                    _invalidate_categories(sql['cat_table'])
                     print("Category name updated successfully.\n")
                 except sqlite3.Error as e:
                     print(f"Error updating category name: {e}\n")
                 return
-            
+
         elif update_delete == 'back':
             continue
 
         else:
             print("Invalid choice. Please enter 'update' or 'delete'.\n")
 
+# Define functions for menu options
+def add_expense(db):
+    """
+    Add a new expense to the database.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    _add_entry(db, "expenses", "expense")
+
+def view_expenses(db):
+    """
+    View all expenses, update an expense, or delete an expense.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    _view_entries(db, "expenses", "expense")
+
+def view_expenses_by_category(db):
+    """
+    View all expenses by category, update a category name or delete a category
+    and all associated expenses.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    _view_entries_by_category(db, "expenses", "expense")
+
+def add_income(db):
+    """
+    Add a new income to the database.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    _add_entry(db, "income", "income")
+
+def view_income(db):
+    """
+    View all incomes, update an income, or delete an income.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    _view_entries(db, "income", "income")
+
+def view_income_by_category(db):
+    """
+    View all incomes by category, update a category name or delete a category
+    and all associated incomes.
+
+    Args:
+        db (sqlite3.Connection): Connection object to the SQLite database.
+
+    Returns:
+        None
+    """
+    _view_entries_by_category(db, "income", "income")
+
 def set_budget(db):
     """
     Set a budget limit for a specific expense category.
@@ -860,56 +903,54 @@ def set_budget(db):
     Returns:
         None
     """
-    cursor = db.cursor()
-
-    # Fetch expense categories from the database
-    cursor.execute('SELECT id, name FROM expense_categories')
-    categories = cursor.fetchall()
+    # Fetch expense categories (cached between category mutations)
+    categories = _get_categories(db, 'expense_categories')
 
     if not categories:
         print("No expense categories found.\n")
         return
 
-    # Display available categories
-    print("Available Expense Categories:")
-    for category in categories:
-        print(f"ID: {category[0]}, Name: {category[1]}")
+    # Map id -> name once so validation and display are O(1) lookups
+    cat_by_id = dict(categories)
 
-    # Prompt user to select a category
-    while True:
-        try:
-            category_id = int(input("\nEnter the ID of the category to set the budget for: ").strip())
-            break
-        except ValueError:
-            print("Invalid input. Please enter a valid category ID.\n")
+    # With a single category there is nothing to choose; skip the prompt
+    if len(categories) == 1:
+        category_id, category_name = categories[0]
+        print(f"Using the only expense category: {category_name}")
+    else:
+        # Display available categories
+        print("Available Expense Categories:")
+        for category in categories:
+            print(f"ID: {category['id']}, Name: {category['name']}")
 
-    # Check if the entered category ID exists
-    if category_id not in [cat[0] for cat in categories]:
-        print("Invalid category ID. Please select a valid category.\n")
-        return
+        # Prompt user to select a category
+        while True:
+            try:
+                category_id = int(input("\nEnter the ID of the category to set the budget for: ").strip())
+                break
+            except ValueError:
+                print("Invalid input. Please enter a valid category ID.\n")
 
-    # Fetch the name of the selected category
-    category_name = [cat[1] for cat in categories if cat[0] == category_id][0]
+        # Check if the entered category ID exists
+        if category_id not in cat_by_id:
+            print("Invalid category ID. Please select a valid category.\n")
+            return
+
+        # Fetch the name of the selected category
+        category_name = cat_by_id[category_id]
 
     # Prompt user to enter the budget limit
-    while True:
-        budget_limit_input = input(f"Enter the budget limit for '{category_name}': ").strip()
-        try:
-            budget_limit = float(budget_limit_input)
-            if budget_limit <= 0:
-                raise ValueError("Budget limit must be a positive number.")
-            break
-        except ValueError as ve:
-            print(f"Invalid input: {ve}\n")
+    budget_limit = round(_prompt_positive_float(
+        f"Enter the budget limit for '{category_name}': ") * 100)
 
     try:
         # Update the budget limit for the category in the database
-        cursor.execute('''
-            UPDATE expense_categories
-            SET budget_limit = ?
-            WHERE id = ?
-        ''', (budget_limit, category_id))
-        db.commit()
+        with db:
+            db.execute('''
+                UPDATE expense_categories
+                SET budget_limit = ?
+                WHERE id = ?
+            ''', (budget_limit, category_id))
         print(f"Budget limit for '{category_name}' set successfully.\n")
     except sqlite3.Error as e:
         print(f"Error setting budget limit: {e}\n")
@@ -924,58 +965,68 @@ def view_budget(db):
     Returns:
         None
     """
-    cursor = db.cursor()
-
-    # Fetch all expense categories from the database
-    cursor.execute('SELECT id, name FROM expense_categories')
-    categories = cursor.fetchall()
+    # Fetch all expense categories (cached between category mutations)
+    categories = _get_categories(db, 'expense_categories')
 
     if not categories:
         print("No expense categories found.")
         return
 
-    print("Expense Categories:\n")
-    for category in categories:
-        print(f"ID: {category[0]}, Name: {category[1]}")
+    # Map id -> name once so validation and display are O(1) lookups
+    cat_by_id = dict(categories)
+
+    # With a single category there is nothing to choose; skip the prompt
+    single_category = len(categories) == 1
+
+    if not single_category:
+        print("Expense Categories:\n")
+        for category in categories:
+            print(f"ID: {category['id']}, Name: {category['name']}")
 
     while True:
-        category_id_input = input("\nEnter the ID of the category to view the budget, or 'back' to return to the main menu: ").strip().lower()
-        
-        if category_id_input == 'back':
-            return
+        if single_category:
+            category_id = categories[0]['id']
+            print(f"Using the only expense category: {cat_by_id[category_id]}")
+        else:
+            category_id_input = input("\nEnter the ID of the category to view the budget, or 'back' to return to the main menu: ").strip().translate(_LOWER)
 
-        try:
-            category_id = int(category_id_input)
-        except ValueError:
-            print("Invalid ID. Please enter a valid category ID.")
-            continue
+            if category_id_input == 'back':
+                return
 
-        # Check if the entered ID is valid
-        valid_category_ids = [category[0] for category in categories]
-        if category_id not in valid_category_ids:
-            print("Category ID not found. Please enter a valid category ID.")
-            continue
+            try:
+                category_id = int(category_id_input)
+            except ValueError:
+                print("Invalid ID. Please enter a valid category ID.")
+                continue
 
-        # Fetch the set budget for the category
-        cursor.execute('SELECT budget_limit FROM expense_categories WHERE id = ?', (category_id,))
-        set_budget = cursor.fetchone()[0]
+            # Check if the entered ID is valid
+            if category_id not in cat_by_id:
+                print("Category ID not found. Please enter a valid category ID.")
+                continue
+
+        # Fetch the set budget and total expenses in a single query
+        set_budget, total_expenses = db.execute(
+            'SELECT ec.budget_limit, COALESCE(SUM(e.amount), 0) '
+            'FROM expense_categories ec '
+            'LEFT JOIN expenses e ON e.category_id = ec.id '
+            'WHERE ec.id = ? GROUP BY ec.id',
+            (category_id,)).fetchone()
 
         if set_budget is None:
-            print(f"No budget has been set for category ID {category_id} ({[category[1] for category in categories if category[0] == category_id][0]}).\n")
+            print(f"No budget has been set for category ID {category_id} "
+                  f"({cat_by_id[category_id]}).\n")
+            if single_category:
+                return
             continue
 
-        # Fetch the total expenses for the category
-        cursor.execute('SELECT SUM(amount) FROM expenses WHERE category_id = ?', (category_id,))
-        total_expenses = cursor.fetchone()[0]
-        total_expenses = total_expenses if total_expenses else 0
-
         # Calculate the remaining budget
         remaining_budget = set_budget - total_expenses
 
-        print(f"\nBudget Overview for Category ID {category_id} ({[category[1] for category in categories if category[0] == category_id][0]}):")
-        print(f"Set Budget: {set_budget}")
-        print(f"Total Expenses: {total_expenses}")
-        print(f"Remaining Budget: {remaining_budget}\n")
+        print(f"\nBudget Overview for Category ID {category_id} "
+              f"({cat_by_id[category_id]}):")
+        print(f"Set Budget: {_fmt_amount(set_budget)}")
+        print(f"Total Expenses: {_fmt_amount(total_expenses)}")
+        print(f"Remaining Budget: {_fmt_amount(remaining_budget)}\n")
 
         return
 
@@ -989,45 +1040,35 @@ def set_goals(db):
     Returns:
         None
     """
-    cursor = db.cursor()
-
     # Input the goal amount
-    while True:
-        goal_amount_input = input("Enter the goal amount: ").strip()
-        try:
-            goal_amount = float(goal_amount_input)
-            if goal_amount <= 0:
-                raise ValueError
-            break
-        except ValueError:
-            print("Invalid amount. Please enter a positive number.")
+    goal_amount = round(
+        _prompt_positive_float("Enter the goal amount: ") * 100)
 
     # Input the target date
     while True:
         target_date = input("Enter the target date (YYYY-MM-DD): ").strip()
         try:
-            datetime.datetime.strptime(target_date, "%Y-%m-%d")
+            datetime.date.fromisoformat(target_date)
             break
         except ValueError:
             print("Invalid date format. Please enter the date in YYYY-MM-DD "
                   "format.")
 
     # Choose a category (optional)
-    cursor.execute('SELECT id, name FROM expense_categories')
-    categories = cursor.fetchall()
+    categories = _get_categories(db, 'expense_categories')
 
     category_id = None
     if categories:
         print("Expense Categories:")
         for category in categories:
-            print(f"ID: {category[0]}, Name: {category[1]}")
+            print(f"ID: {category['id']}, Name: {category['name']}")
 
         category_input = input("Enter the ID of the category related to this "
                                "goal, or press enter to skip: ").strip()
         if category_input:
             try:
                 category_id = int(category_input)
-                if category_id not in [category[0] for category in categories]:
+                if category_id not in [category['id'] for category in categories]:
                     print("Category ID not found. Skipping category "
                           "selection.")
                     category_id = None
@@ -1036,18 +1077,19 @@ def set_goals(db):
 
     # Insert the goal into the database
     try:
-        cursor.execute('''
-            INSERT INTO financial_goals (goal_amount, target_date, category_id) 
-            VALUES (?, ?, ?)
-        ''', (goal_amount, target_date, category_id))
-        db.commit()
+        with db:
+            db.execute('''
+                INSERT INTO financial_goals (goal_amount, target_date,
+                           category_id)
+                VALUES (?, ?, ?)
+            ''', (goal_amount, target_date, category_id))
         print("Financial goal set successfully.")
     except sqlite3.Error as e:
         print(f"Error setting financial goal: {e}")
 
 def view_goals_progress(db):
     """
-    View progress towards financial goals, including the amount saved/spent 
+    View progress towards financial goals, including the amount saved/spent
     and the remaining amount needed to achieve each goal.
 
     Args:
@@ -1056,127 +1098,172 @@ def view_goals_progress(db):
     Returns:
         None
     """
-    cursor = db.cursor()
-
-    # Fetch all financial goals from the database
-    cursor.execute('''
-        SELECT financial_goals.id, financial_goals.goal_amount, 
-                   financial_goals.target_date, expense_categories.name
+    only_outstanding = input(
+        "Show only outstanding goals? (yes/no): ").strip().translate(_LOWER) == 'yes'
+
+    # Compute each goal's progress in a single query: the CTEs aggregate
+    # income and expenses per category once, and 'General' goals (no
+    # category) fall back to the overall net via the totals CTE
+    query = '''
+        WITH inc AS (
+            SELECT income_categories.name AS name,
+                   SUM(income.amount) AS total
+            FROM income
+            JOIN income_categories
+                ON income.category_id = income_categories.id
+            GROUP BY income_categories.name
+        ),
+        exp AS (
+            SELECT expense_categories.name AS name,
+                   SUM(expenses.amount) AS total
+            FROM expenses
+            JOIN expense_categories
+                ON expenses.category_id = expense_categories.id
+            GROUP BY expense_categories.name
+        ),
+        totals AS (
+            SELECT COALESCE((SELECT SUM(amount) FROM income), 0)
+                   - COALESCE((SELECT SUM(amount) FROM expenses), 0) AS net
+        )
+        SELECT financial_goals.id,
+               financial_goals.goal_amount AS goal_amount,
+               financial_goals.target_date,
+               COALESCE(expense_categories.name, 'General'),
+               CASE WHEN expense_categories.name IS NULL THEN totals.net
+                    ELSE COALESCE(inc.total, 0) - COALESCE(exp.total, 0)
+               END AS progress
         FROM financial_goals
-        LEFT JOIN expense_categories ON financial_goals.category_id = 
-                   expense_categories.id
-    ''')
-    goals = cursor.fetchall()
-
-    if not goals:
-        print("No financial goals found.\n")
-        return
+        LEFT JOIN expense_categories
+            ON financial_goals.category_id = expense_categories.id
+        LEFT JOIN inc ON inc.name = expense_categories.name
+        LEFT JOIN exp ON exp.name = expense_categories.name
+        CROSS JOIN totals
+    '''
 
-    print("Financial Goals:\n")
-
-    for goal in goals:
-        goal_id, goal_amount, target_date, category_name = goal
-        category_name = category_name if category_name else "General"
+    # Filter achieved goals in SQL so Python never formats rows that
+    # would be dropped anyway
+    if only_outstanding:
+        query = f'SELECT * FROM ({query}) WHERE progress < goal_amount'
 
-        # Calculate the progress towards the goal
-        if category_name == "General":
-            cursor.execute('SELECT SUM(amount) FROM income')
-            total_income = cursor.fetchone()[0] or 0
+    goals = db.execute(query)
 
-            cursor.execute('SELECT SUM(amount) FROM expenses')
-            total_expenses = cursor.fetchone()[0] or 0
+    # Stream rows straight off the cursor into the report instead of
+    # materialising every goal with fetchall first
+    lines = []
 
-            progress = total_income - total_expenses
-        else:
-            cursor.execute('''
-                SELECT SUM(amount) FROM income
-                JOIN income_categories ON income.category_id = 
-                           income_categories.id
-                WHERE income_categories.name = ?
-            ''', (category_name,))
-            total_income = cursor.fetchone()[0] or 0
-
-            cursor.execute('''
-                SELECT SUM(amount) FROM expenses
-                JOIN expense_categories ON expenses.category_id = 
-                           expense_categories.id
-                WHERE expense_categories.name = ?
-            ''', (category_name,))
-            total_expenses = cursor.fetchone()[0] or 0
-
-            progress = total_income - total_expenses
+    for goal in goals:
+        goal_id, goal_amount, target_date, category_name, progress = goal
 
         remaining = goal_amount - progress
         progress_percentage = (progress / goal_amount) * 100 if goal_amount != 0 else 0
 
-        print(f"Goal ID: {goal_id}")
-        print(f"Goal Amount: {goal_amount}")
-        print(f"Target Date: {target_date}")
-        print(f"Category: {category_name}")
-        print(f"Progress: {progress} ({progress_percentage:.2f}%)")
-        print(f"Remaining Amount: {remaining}\n")
+        lines.append(f"Goal ID: {goal_id}\n"
+                     f"Goal Amount: {_fmt_amount(goal_amount)}\n"
+                     f"Target Date: {target_date}\n"
+                     f"Category: {category_name}\n"
+                     f"Progress: {_fmt_amount(progress)} "
+                     f"({progress_percentage:.2f}%)\n"
+                     f"Remaining Amount: {_fmt_amount(remaining)}\n")
 
-        if remaining < 0:
-            print(f"Congratulations, you have achieved the {category_name} "
-                  f"financial goal!\n")
+        if remaining <= 0:
+            lines.append(f"Congratulations, you have achieved the "
+                         f"{category_name} financial goal!\n")
+
+    if not lines:
+        print("No financial goals found.\n")
+        return
+
+    print("Financial Goals:\n")
+    print("\n".join(lines))
+
+# Built once at import; emitting the menu is then a single write
+_MENU = "\n".join((
+    "1. Add expense",
+    "2. View expenses",
+    "3. View expenses by category",
+    "4. Add income",
+    "5. View income",
+    "6. View income by category",
+    "7. Set budget for a category",
+    "8. View budget for a category",
+    "9. Set financial goals",
+    "10. View progress towards financial goals",
+    "11. Quit",
+))
 
 def main_menu():
     """Display the main menu options."""
-    print("1. Add expense")
-    print("2. View expenses")
-    print("3. View expenses by category")
-    print("4. Add income")
-    print("5. View income")
-    print("6. View income by category")
-    print("7. Set budget for a category")
-    print("8. View budget for a category")
-    print("9. Set financial goals")
-    print("10. View progress towards financial goals")
-    print("11. Quit")
+    print(_MENU)
 
 def main():
     # Connect to the database
     db = connect_to_db()
 
-    # Create tables if they don't exist
     if db:
-        create_tables(db)
-        insert_preset_data(db)
-
-        print("\nTables created and preset data inserted successfully.\n")
+        # Bootstrap only the first time this database is opened:
+        # user_version is 0 on a fresh file and set to 1 once the schema
+        # and preset data are in place, so later launches skip the DDL
+        # and avoid re-inserting the preset rows. Version 0 with tables
+        # already present means a database from before schema versioning:
+        # migrate its data in place rather than re-seeding it.
+        if db.execute("PRAGMA user_version").fetchone()[0] == 0:
+            legacy = db.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'expenses' LIMIT 1"
+            ).fetchone()
+
+            if legacy:
+                _migrate_legacy_db(db)
+                print("\nDatabase upgraded to the current schema.\n")
+            else:
+                # Run the whole bootstrap as one transaction so it costs
+                # one commit
+                with db:
+                    create_tables(db)
+                    insert_preset_data(db)
+                    db.execute("PRAGMA user_version = 1")
+
+                print("\nTables created and preset data inserted "
+                      "successfully.\n")
     else:
         print("\nFailed to connect to the database.\n")
 
-    while True:
-        # Display main menu
-        main_menu()
-        choice = input("\nEnter your choice: ")
-        
-        # Perform actions based on user choice
-        if choice == '1':
-            add_expense(db)
-        elif choice == '2':
-            view_expenses(db)
-        elif choice == '3':
-            view_expenses_by_category(db)
-        elif choice == '4':
-            add_income(db)
-        elif choice == '5':
-            view_income(db)
-        elif choice == '6':
-            view_income_by_category(db)
-        elif choice == '7':
-            set_budget(db)
-        elif choice == '8':
-            view_budget(db)
-        elif choice == '9':
-            set_goals(db)
-        elif choice == '10':
-            view_goals_progress(db)
-        elif choice == '11':
-            print("\nGoodbye!\n")
-            break
-        else:
-            print("Invalid choice. Please try again.")
+    # Map menu choices straight to their handlers instead of walking an
+    # if/elif chain for every selection
+    actions = {
+        '1': add_expense,
+        '2': view_expenses,
+        '3': view_expenses_by_category,
+        '4': add_income,
+        '5': view_income,
+        '6': view_income_by_category,
+        '7': set_budget,
+        '8': view_budget,
+        '9': set_goals,
+        '10': view_goals_progress,
+    }
+
+    # One long-lived connection serves the whole session (so every cache
+    # and prepared statement is reused); close it cleanly on exit so WAL
+    # content is checkpointed back into the main database file
+    try:
+        while True:
+            # Display main menu
+            main_menu()
+            choice = input("\nEnter your choice: ")
+
+            if choice == '11':
+                print("\nGoodbye!\n")
+                break
+
+            action = actions.get(choice)
+            if action:
+                action(db)
+            else:
+                print("Invalid choice. Please try again.")
+    finally:
+        if db:
+            db.close()
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()